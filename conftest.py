@@ -0,0 +1,49 @@
+"""
+Shared fixtures for the model router and API tests.
+"""
+
+import os
+import shutil
+import threading
+
+import pytest
+
+import model_router
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MODEL_FILE = os.path.join(HERE, 'service_request_model.pkl')
+ENCODERS_FILE = os.path.join(HERE, 'encoders.pkl')
+MODEL_SIZE = os.path.getsize(MODEL_FILE) + os.path.getsize(ENCODERS_FILE)
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    """A model directory with copies of the shipped model under several keys."""
+    for key in ('a', 'b', 'c', 'slow', 'bad'):
+        os.makedirs(tmp_path / key)
+        shutil.copy(MODEL_FILE, tmp_path / key)
+        shutil.copy(ENCODERS_FILE, tmp_path / key)
+    with open(tmp_path / 'bad' / 'service_request_model.pkl', 'wb') as f:
+        f.write(b'not a pickle')
+    return str(tmp_path)
+
+
+@pytest.fixture
+def slow_load(model_dir, monkeypatch):
+    """Block loading of the 'slow' model until the returned release event is set.
+
+    Returns ``(started, release)`` events.
+    """
+    started = threading.Event()
+    release = threading.Event()
+    load_model = model_router.ServiceRequestPredictor.load_model
+
+    def blocking_load(self):
+        if os.path.join(model_dir, 'slow') in self.model_file:
+            started.set()
+            release.wait(10)
+        return load_model(self)
+
+    monkeypatch.setattr(model_router.ServiceRequestPredictor, 'load_model', blocking_load)
+    yield started, release
+    release.set()
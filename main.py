@@ -4,6 +4,7 @@ Main entry point for the Python project - Service Request Resolution Time Predic
 
 from flask import Flask, render_template_string, request, jsonify
 from prediction_model import predictor
+from model_router import router, ModelNotFoundError
 import json
 
 app = Flask(__name__)
@@ -387,8 +388,14 @@ def predict():
             if field not in data:
                 return jsonify({'error': f'Missing required field: {field}'}), 400
         
+        # Use the per-segment model when one is requested, else the global model
+        model_key = data.get('model')
+        if model_key is not None and (not isinstance(model_key, str) or not model_key):
+            return jsonify({'error': 'Field model must be a non-empty string'}), 400
+        model = router.get(model_key) if model_key is not None else predictor
+        
         # Make prediction
-        prediction_hours = predictor.predict(
+        prediction_hours = model.predict(
             category=data['category'],
             priority=data['priority'],
             assigned_team=data['assigned_team'],
@@ -403,13 +410,22 @@ def predict():
             'category': data['category'],
             'priority': data['priority'],
             'assigned_team': data['assigned_team'],
-            'complexity_score': data['complexity_score']
+            'complexity_score': data['complexity_score'],
+            'model': model_key
         })
         
+    except ModelNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/models')
+def api_models():
+    """API endpoint reporting available and loaded models."""
+    return jsonify(router.stats())
+
+
 @app.route('/api/hello')
 def api_hello():
     """API endpoint example."""
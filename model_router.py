@@ -0,0 +1,167 @@
+"""
+Model Router for Serving Many Service Request Models from One Process
+"""
+
+from collections import OrderedDict
+import os
+import threading
+import time
+
+from prediction_model import ServiceRequestPredictor
+
+
+class ModelNotFoundError(LookupError):
+    """Raised when no trained model exists for a requested key."""
+
+
+class ModelLoadError(RuntimeError):
+    """Raised when a model exists on disk but cannot be loaded."""
+
+
+class ModelRouter:
+    """Lazily load per-key predictors and keep them within a memory budget.
+
+    Each key maps to a sub-directory of ``model_dir`` holding the same
+    ``service_request_model.pkl`` / ``encoders.pkl`` pair written by
+    ``ServiceRequestPredictor.save_model``. Resident memory is estimated
+    from the size of those files. The least recently used models are
+    evicted only after a new model has loaded successfully, so a broken
+    model never pushes out healthy ones. Loads never wait on each other:
+    while several models are being read at once the process can exceed the
+    budget by the size of those in-flight models, and a single model larger
+    than the budget is still kept resident on its own.
+    """
+
+    def __init__(self, model_dir='models', memory_budget_bytes=512 * 1024 * 1024,
+                 model_file='service_request_model.pkl', encoders_file='encoders.pkl'):
+        self.model_dir = model_dir
+        self.memory_budget_bytes = memory_budget_bytes
+        self.model_file = model_file
+        self.encoders_file = encoders_file
+
+        # key -> predictor, ordered from least to most recently used
+        self._models = OrderedDict()
+        self._stats = {}
+        self._lock = threading.Lock()
+        # key -> estimated size of models currently being read from disk
+        self._loading = {}
+        # key -> [lock, waiters]; one lock per key so a slow load only blocks
+        # requests for that key. Entries are dropped once nobody is waiting.
+        self._load_locks = {}
+
+    def _model_paths(self, key):
+        """Return the model and encoder file paths for a key."""
+        if (not isinstance(key, str) or not key or os.sep in key
+                or (os.altsep and os.altsep in key) or key in ('.', '..')):
+            raise ModelNotFoundError(f"Invalid model key: {key!r}")
+        base = os.path.join(self.model_dir, key)
+        return os.path.join(base, self.model_file), os.path.join(base, self.encoders_file)
+
+    def _touch(self, key):
+        """Mark a resident model as used and return it.
+
+        Must be called with ``self._lock`` held.
+        """
+        self._models.move_to_end(key)
+        self._stats[key]['hits'] += 1
+        self._stats[key]['last_used'] = time.time()
+        return self._models[key]
+
+    def get(self, key):
+        """Return the loaded predictor for a key, loading it if needed."""
+        model_path, encoders_path = self._model_paths(key)
+
+        with self._lock:
+            if key in self._models:
+                return self._touch(key)
+
+        if not (os.path.exists(model_path) and os.path.exists(encoders_path)):
+            raise ModelNotFoundError(f"No model found for key: {key}")
+
+        with self._lock:
+            entry = self._load_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                # Another thread may have finished loading while we waited
+                with self._lock:
+                    if key in self._models:
+                        return self._touch(key)
+                return self._load(key, model_path, encoders_path)
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0 and self._load_locks.get(key) is entry:
+                    del self._load_locks[key]
+
+    def _load(self, key, model_path, encoders_path):
+        """Load a model from disk and make room for it once it has loaded."""
+        size = os.path.getsize(model_path) + os.path.getsize(encoders_path)
+        with self._lock:
+            self._loading[key] = size
+
+        try:
+            predictor = ServiceRequestPredictor(model_file=model_path, encoders_file=encoders_path)
+            start = time.perf_counter()
+            if not predictor.load_model():
+                raise ModelLoadError(f"Could not load model for key: {key}")
+            load_seconds = time.perf_counter() - start
+
+            with self._lock:
+                self._models[key] = predictor
+                self._stats[key] = {
+                    'load_seconds': load_seconds,
+                    'resident_bytes': size,
+                    'hits': 1,
+                    'last_used': time.time(),
+                }
+                self._evict()
+            return predictor
+        finally:
+            with self._lock:
+                del self._loading[key]
+
+    def _evict(self):
+        """Drop least recently used models until within the memory budget.
+
+        The most recently used model is always kept. Must be called with
+        ``self._lock`` held.
+        """
+        while len(self._models) > 1 and self.resident_bytes() > self.memory_budget_bytes:
+            oldest, _ = self._models.popitem(last=False)
+            stats = self._stats.pop(oldest)
+            print(f"Evicted model '{oldest}' ({stats['resident_bytes']} bytes)")
+
+    def resident_bytes(self):
+        """Total estimated memory used by resident models."""
+        return sum(stats['resident_bytes'] for stats in self._stats.values())
+
+    def available_models(self):
+        """List model keys present in the model directory."""
+        if not os.path.isdir(self.model_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.model_dir)
+            if os.path.exists(os.path.join(self.model_dir, name, self.model_file))
+            and os.path.exists(os.path.join(self.model_dir, name, self.encoders_file))
+        )
+
+    def stats(self):
+        """Report per-model load times and resident memory."""
+        available = self.available_models()
+        with self._lock:
+            return {
+                'memory_budget_bytes': self.memory_budget_bytes,
+                'resident_bytes': self.resident_bytes(),
+                'available': available,
+                'loading': dict(self._loading),
+                'resident': {key: dict(stats) for key, stats in self._stats.items()},
+            }
+
+
+# Initialize global router instance
+router = ModelRouter(
+    model_dir=os.environ.get('MODEL_DIR', 'models'),
+    memory_budget_bytes=int(os.environ.get('MODEL_MEMORY_BUDGET_MB', 512)) * 1024 * 1024,
+)
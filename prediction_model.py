@@ -14,13 +14,13 @@ import os
 class ServiceRequestPredictor:
     """AI model to predict service request resolution time."""
     
-    def __init__(self):
+    def __init__(self, model_file='service_request_model.pkl', encoders_file='encoders.pkl'):
         self.model = None
         self.category_encoder = LabelEncoder()
         self.priority_encoder = LabelEncoder()
         self.assigned_team_encoder = LabelEncoder()
-        self.model_file = 'service_request_model.pkl'
-        self.encoders_file = 'encoders.pkl'
+        self.model_file = model_file
+        self.encoders_file = encoders_file
         
     def generate_sample_data(self, n_samples=500):
         """Generate sample training data for demonstration."""
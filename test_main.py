@@ -0,0 +1,59 @@
+"""
+Tests for the prediction API.
+"""
+
+import pytest
+
+import main
+from model_router import ModelRouter
+
+REQUEST = {
+    'category': 'Network',
+    'priority': 'High',
+    'assigned_team': 'IT Support',
+    'complexity_score': 5,
+}
+
+
+@pytest.fixture
+def client(model_dir, monkeypatch):
+    monkeypatch.setattr(main, 'router', ModelRouter(model_dir))
+    return main.app.test_client()
+
+
+def test_predict_with_default_model(client):
+    response = client.post('/api/predict', json=REQUEST)
+    assert response.status_code == 200
+    assert response.json['model'] is None
+    assert response.json['prediction_hours'] >= 0.5
+
+
+def test_predict_with_segment_model(client):
+    response = client.post('/api/predict', json=dict(REQUEST, model='a'))
+    assert response.status_code == 200
+    assert response.json['model'] == 'a'
+
+
+@pytest.mark.parametrize('model', ['', 1, ['a'], {'a': 1}])
+def test_predict_rejects_invalid_model(client, model):
+    response = client.post('/api/predict', json=dict(REQUEST, model=model))
+    assert response.status_code == 400
+
+
+def test_predict_unknown_model(client):
+    response = client.post('/api/predict', json=dict(REQUEST, model='missing'))
+    assert response.status_code == 404
+
+
+def test_predict_broken_model(client):
+    response = client.post('/api/predict', json=dict(REQUEST, model='bad'))
+    assert response.status_code == 500
+
+
+def test_models_endpoint(client):
+    client.post('/api/predict', json=dict(REQUEST, model='a'))
+    response = client.get('/api/models')
+    assert response.status_code == 200
+    assert response.json['available'] == ['a', 'b', 'bad', 'c', 'slow']
+    assert list(response.json['resident']) == ['a']
+    assert response.json['loading'] == {}
@@ -0,0 +1,102 @@
+"""
+Tests for the per-segment model router.
+"""
+
+import os
+import threading
+
+import pytest
+
+from conftest import MODEL_SIZE
+from model_router import ModelRouter, ModelNotFoundError, ModelLoadError
+
+
+def _start_slow_load(router, started):
+    """Start loading the 'slow' model in the background and wait until it blocks."""
+    thread = threading.Thread(target=router.get, args=('slow',))
+    thread.start()
+    assert started.wait(10)
+    return thread
+
+
+def test_evicts_least_recently_used(model_dir):
+    router = ModelRouter(model_dir, memory_budget_bytes=MODEL_SIZE * 2 + MODEL_SIZE // 2)
+    for key in ('a', 'b', 'a', 'c'):
+        router.get(key)
+    assert list(router.stats()['resident']) == ['a', 'c']
+    assert router.resident_bytes() <= router.memory_budget_bytes
+
+
+def test_resident_model_is_reused(model_dir):
+    router = ModelRouter(model_dir)
+    assert router.get('a') is router.get('a')
+    assert router.stats()['resident']['a']['hits'] == 2
+
+
+@pytest.mark.parametrize('key', ['', '.', '..', 'x/y', '../a', 1, None, ['a'], {'a': 1}])
+def test_rejects_invalid_keys(model_dir, key):
+    router = ModelRouter(model_dir)
+    with pytest.raises(ModelNotFoundError):
+        router.get(key)
+    assert router.stats()['resident'] == {}
+
+
+def test_unknown_keys_do_not_leak_locks(model_dir):
+    router = ModelRouter(model_dir)
+    for i in range(100):
+        with pytest.raises(ModelNotFoundError):
+            router.get(f'missing-{i}')
+    assert router._load_locks == {}
+
+
+def test_load_error_keeps_resident_models(model_dir):
+    router = ModelRouter(model_dir, memory_budget_bytes=MODEL_SIZE * 2)
+    router.get('a')
+    router.get('b')
+    for _ in range(3):
+        with pytest.raises(ModelLoadError):
+            router.get('bad')
+    stats = router.stats()
+    assert list(stats['resident']) == ['a', 'b']
+    assert stats['loading'] == {}
+
+
+def test_available_models_requires_both_files(model_dir):
+    os.remove(os.path.join(model_dir, 'b', 'encoders.pkl'))
+    router = ModelRouter(model_dir)
+    assert router.available_models() == ['a', 'bad', 'c', 'slow']
+
+
+def test_slow_load_does_not_block_resident_model(model_dir, slow_load):
+    started, release = slow_load
+    router = ModelRouter(model_dir)
+    loaded = router.get('a')
+
+    slow = _start_slow_load(router, started)
+    assert router.get('a') is loaded
+    release.set()
+    slow.join(10)
+    assert sorted(router.stats()['resident']) == ['a', 'slow']
+
+
+def test_slow_load_does_not_block_cold_load_under_tight_budget(model_dir, slow_load):
+    started, release = slow_load
+    router = ModelRouter(model_dir, memory_budget_bytes=MODEL_SIZE + MODEL_SIZE // 2)
+    router.get('a')
+
+    slow = _start_slow_load(router, started)
+    assert router.stats()['loading'] == {'slow': MODEL_SIZE}
+
+    result = []
+    cold = threading.Thread(target=lambda: result.append(router.get('b')))
+    cold.start()
+    cold.join(5)
+    assert not cold.is_alive()
+    assert len(result) == 1
+    assert list(router.stats()['resident']) == ['b']
+
+    release.set()
+    slow.join(10)
+    stats = router.stats()
+    assert list(stats['resident']) == ['slow']
+    assert stats['loading'] == {}